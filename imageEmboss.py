@@ -2,31 +2,74 @@ import os
 import sys
 import cv2
 import numpy as np
-import ezdxf
+from ezdxf.addons.r12writer import r12writer
 import math
-from tkinter import Tk, filedialog, simpledialog, messagebox, ttk, Canvas, PhotoImage, DoubleVar, IntVar, BooleanVar, StringVar
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import Tk, Toplevel, filedialog, simpledialog, messagebox, ttk, Canvas, PhotoImage, DoubleVar, IntVar, BooleanVar, StringVar
 try:
     from tkinterdnd2 import DND_FILES, TkinterDnD
     DRAG_DROP_AVAILABLE = True
 except ImportError:
     DRAG_DROP_AVAILABLE = False
 from PIL import Image, ImageTk
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Route the filtering stages through the GPU when OpenCV was built with CUDA
+try:
+    CUDA_AVAILABLE = cv2.cuda.getCudaEnabledDeviceCount() > 0
+except (AttributeError, cv2.error):
+    CUDA_AVAILABLE = False
+
+# Delay (ms) used to coalesce a burst of slider events into one pipeline run
+PREVIEW_DEBOUNCE_MS = 120
+
+# Largest image (in pixels) the pipeline works on; bigger inputs are shrunk
+# on load so preview and export stay responsive
+MAX_PIXELS = 4_000_000
+
+# Default cap on vertices per contour; keeps canvas drawing and DXF writing
+# bounded on noisy images
+MAX_CONTOUR_VERTICES = 2000
+
+# File extensions accepted by drag-and-drop
+_IMG_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff', '.webp'})
 
 # -------------------------
 # Helpers
 # -------------------------
+_ROOT = None
+
+def _hidden_root():
+    """Shared withdrawn Tk root that parents the standalone dialog helpers"""
+    global _ROOT
+    if _ROOT is None:
+        _ROOT = Tk()
+        _ROOT.withdraw()
+    return _ROOT
+
 def choose_input_image():
-    Tk().withdraw()
     filetypes = [
         ("Images", "*.jpg;*.jpeg;*.png;*.bmp;*.tif;*.tiff;*.webp"),
         ("All files", "*.*"),
     ]
-    path = filedialog.askopenfilename(title="Select an image to convert", filetypes=filetypes)
+    path = filedialog.askopenfilename(title="Select an image to convert", filetypes=filetypes,
+                                      parent=_hidden_root())
     return path
 
 def choose_output_dxf(default_name="output.dxf"):
-    Tk().withdraw()
     path = filedialog.asksaveasfilename(
+        parent=_hidden_root(),
         title="Save DXF as",
         defaultextension=".dxf",
         initialfile=default_name,
@@ -42,19 +85,19 @@ def ask_params():
     largest_n: keep top N largest contours only.
     simplify: Douglas–Peucker epsilon as percentage of image diagonal (0..5 typical). 0 disables.
     """
-    Tk().withdraw()
+    parent = _hidden_root()
     try:
         threshold = simpledialog.askfloat(
             "Threshold",
             "Threshold 0..255 (-1 = Otsu, recommended):",
             initialvalue=-1.0,
-            minvalue=-1.0, maxvalue=255.0)
+            minvalue=-1.0, maxvalue=255.0, parent=parent)
         if threshold is None: return None
 
         morph = simpledialog.askinteger(
             "Cleanup",
             "Morph kernel size in px (odd, 0 disables). 3 or 5 is typical:",
-            initialvalue=5, minvalue=0, maxvalue=51)
+            initialvalue=5, minvalue=0, maxvalue=51, parent=parent)
         if morph is None: return None
         if morph % 2 == 0 and morph != 0:
             morph += 1  # ensure odd
@@ -62,26 +105,26 @@ def ask_params():
         largest_n = simpledialog.askinteger(
             "Limit shapes",
             "Keep N largest contours only (1..50). Use 1–3 to get a bold silhouette:",
-            initialvalue=3, minvalue=1, maxvalue=50)
+            initialvalue=3, minvalue=1, maxvalue=50, parent=parent)
         if largest_n is None: return None
 
         simplify_pct = simpledialog.askfloat(
             "Simplify",
             "Simplify epsilon as % of image diagonal (0 disables, try 0.2..1.5):",
-            initialvalue=0.6, minvalue=0.0, maxvalue=5.0)
+            initialvalue=0.6, minvalue=0.0, maxvalue=5.0, parent=parent)
         if simplify_pct is None: return None
 
         mm_per_px = simpledialog.askfloat(
             "Scale",
             "DXF scale in mm per pixel (1.0 = 1 px becomes 1 mm in DXF):",
-            initialvalue=0.25, minvalue=0.001, maxvalue=100.0)
+            initialvalue=0.25, minvalue=0.001, maxvalue=100.0, parent=parent)
         if mm_per_px is None: return None
 
         invert_bw = messagebox.askyesno(
             "Invert",
             "Invert black/white before vectorizing?\n"
             "Yes = treat light subject on dark background.\n"
-            "No = default (dark subject becomes silhouette).")
+            "No = default (dark subject becomes silhouette).", parent=parent)
 
         return {
             "threshold": threshold,
@@ -92,115 +135,658 @@ def ask_params():
             "invert": invert_bw
         }
     except Exception as e:
-        messagebox.showerror("Error", str(e))
+        messagebox.showerror("Error", str(e), parent=parent)
         return None
 
-def find_edges_and_contours(img_bgr, params):
-    gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
+@lru_cache(maxsize=None)
+def _rect_kernel(size):
+    """Square structuring element, built once per size (treat as read-only)"""
+    return cv2.getStructuringElement(cv2.MORPH_RECT, (size, size))
+
+# Pipeline stages. Each accepts an optional dst buffer to write into so a
+# cached stage can be recomputed without allocating a fresh image.
+def _stage_gray(img_bgr, dst=None):
+    return cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY, dst=dst)
+
+def _stage_bilateral(gray, diameter, sigma_color, sigma_space, dst=None):
+    return cv2.bilateralFilter(gray, diameter, sigma_color, sigma_space, dst=dst)
+
+def _stage_blur(bilateral, kernel_size, dst=None):
+    return cv2.GaussianBlur(bilateral, (kernel_size, kernel_size), 0, dst=dst)
+
+def _stage_canny(blurred, lower, upper, dst=None):
+    # cv2.Canny is already vectorized (OpenCV universal intrinsics) and writes
+    # into the recycled stage buffer, so there is no per-call allocation to save
+    return cv2.Canny(blurred, lower, upper, edges=dst)
+
+def _stage_dilate(edges, thickness, dst=None):
+    # Create kernel based on edge thickness. No need to split it into (k, 1)
+    # and (1, k) passes: OpenCV already dilates all-ones rectangular kernels
+    # separably, and two explicit calls just add an extra image pass.
+    kernel = _rect_kernel(max(1, int(thickness)))
+    return cv2.dilate(edges, kernel, dst=dst, iterations=1)
 
+# CUDA filter objects, built once per parameter set (only the pipeline worker uses them)
+@lru_cache(maxsize=16)
+def _gpu_gaussian_filter(kernel_size):
+    return cv2.cuda.createGaussianFilter(cv2.CV_8UC1, cv2.CV_8UC1, (kernel_size, kernel_size), 0)
+
+@lru_cache(maxsize=16)
+def _gpu_canny_detector(lower, upper):
+    return cv2.cuda.createCannyEdgeDetector(lower, upper)
+
+@lru_cache(maxsize=16)
+def _gpu_dilate_filter(size):
+    return cv2.cuda.createMorphologyFilter(cv2.MORPH_DILATE, cv2.CV_8UC1, _rect_kernel(size))
+
+def _gpu_stage_upload(img, dst=None):
+    gpu_img = dst if dst is not None else cv2.cuda_GpuMat()
+    gpu_img.upload(img)
+    return gpu_img
+
+def _gpu_stage_gray(gpu_bgr, dst=None):
+    return cv2.cuda.cvtColor(gpu_bgr, cv2.COLOR_BGR2GRAY, dst=dst)
+
+def _gpu_stage_bilateral(gpu_gray, diameter, sigma_color, sigma_space, dst=None):
+    return cv2.cuda.bilateralFilter(gpu_gray, diameter, sigma_color, sigma_space, dst=dst)
+
+def _gpu_stage_blur(gpu_bilateral, kernel_size, dst=None):
+    return _gpu_gaussian_filter(kernel_size).apply(gpu_bilateral, dst=dst)
+
+def _gpu_stage_canny(gpu_blurred, lower, upper, dst=None):
+    return _gpu_canny_detector(lower, upper).detect(gpu_blurred, edges=dst)
+
+def _cached_stage(cache, name, key, func, *args):
+    """
+    Return the output of a pipeline stage, reusing the cached result when the
+    parameters it depends on (key) are unchanged. One slot is kept per stage;
+    on a miss the stale slot's buffer is handed to func as dst.
+    """
+    if cache is None:
+        return func(*args)
+    entry = cache.get(name)
+    if entry is not None and entry[0] == key:
+        return entry[1]
+    result = func(*args, dst=entry[1] if entry is not None else None)
+    cache[name] = (key, result)
+    return result
+
+class PipelineCancelled(Exception):
+    """Raised between pipeline stages once a newer request has superseded the run"""
+
+def _check_cancelled(cancelled):
+    if cancelled is not None and cancelled():
+        raise PipelineCancelled()
+
+def _edges_cpu(gray, params, cache, cancelled=None):
+    """Filter + Canny on the CPU; returns (edges, cache key of the edges)"""
     # Apply bilateral filter
-    bilateral = cv2.bilateralFilter(
-        gray,
+    bilateral_key = (
         params["bilateral_diameter"],
         params["bilateral_sigma_color"],
         params["bilateral_sigma_space"]
     )
+    bilateral = _cached_stage(cache, "bilateral", bilateral_key,
+                              _stage_bilateral, gray, *bilateral_key)
+    _check_cancelled(cancelled)
 
-    # Apply Gaussian blur
-    blurred = cv2.GaussianBlur(
-        bilateral,
-        (params["gaussian_kernel_size"], params["gaussian_kernel_size"]),
-        0
-    )
+    # Apply Gaussian blur (kernel <= 1 means off: the bilateral output is
+    # already denoised and Canny smooths via its Sobel pass)
+    blur_key = bilateral_key + (params["gaussian_kernel_size"],)
+    if params["gaussian_kernel_size"] <= 1:
+        blurred = bilateral
+    else:
+        blurred = _cached_stage(cache, "blurred", blur_key,
+                                _stage_blur, bilateral, params["gaussian_kernel_size"])
+        _check_cancelled(cancelled)
 
     # Apply Canny edge detection
-    edges = cv2.Canny(
-        blurred,
-        params["canny_lower_threshold"],
-        params["canny_upper_threshold"]
+    canny_key = blur_key + (params["canny_lower_threshold"], params["canny_upper_threshold"])
+    edges = _cached_stage(cache, "edges", canny_key,
+                          _stage_canny, blurred,
+                          params["canny_lower_threshold"], params["canny_upper_threshold"])
+    return edges, canny_key
+
+def _mask_cuda(img_bgr, params, cache, cancelled=None):
+    """
+    GPU version of the whole mask pipeline. Every stage runs on the device;
+    only the finished mask is downloaded. The calls use the default (blocking)
+    stream, so cancelled is polled between stages just like on the CPU.
+    """
+    # Upload once per image; slider changes reuse the device copies
+    gpu_bgr = _cached_stage(cache, "gpu_bgr", (), _gpu_stage_upload, img_bgr)
+    gpu_gray = _cached_stage(cache, "gpu_gray", (), _gpu_stage_gray, gpu_bgr)
+    _check_cancelled(cancelled)
+
+    bilateral_key = (
+        params["bilateral_diameter"],
+        params["bilateral_sigma_color"],
+        params["bilateral_sigma_space"]
     )
+    gpu_bilateral = _cached_stage(cache, "gpu_bilateral", bilateral_key,
+                                  _gpu_stage_bilateral, gpu_gray, *bilateral_key)
+    _check_cancelled(cancelled)
 
-    # Create kernel based on edge thickness
-    kernel_size = max(1, int(params["edge_thickness"]))
-    kernel = np.ones((kernel_size, kernel_size), np.uint8)
-    
-    # Thicken edges using the kernel
-    thickened_edges = cv2.dilate(edges, kernel, iterations=1)
+    blur_key = bilateral_key + (params["gaussian_kernel_size"],)
+    if params["gaussian_kernel_size"] <= 1:
+        gpu_blurred = gpu_bilateral
+    else:
+        gpu_blurred = _cached_stage(cache, "gpu_blurred", blur_key,
+                                    _gpu_stage_blur, gpu_bilateral, params["gaussian_kernel_size"])
+        _check_cancelled(cancelled)
+
+    canny_key = blur_key + (params["canny_lower_threshold"], params["canny_upper_threshold"])
+    gpu_edges = _cached_stage(cache, "gpu_edges", canny_key,
+                              _gpu_stage_canny, gpu_blurred,
+                              params["canny_lower_threshold"], params["canny_upper_threshold"])
+    _check_cancelled(cancelled)
     
-    # Invert if needed (for silhouette-style output)
+    # Thicken and invert into a fresh device buffer so the cached edges stay untouched
+    gpu_mask = _gpu_dilate_filter(max(1, int(params["edge_thickness"]))).apply(gpu_edges)
     if params["invert"]:
-        thickened_edges = 255 - thickened_edges
+        cv2.cuda.bitwise_not(gpu_mask, dst=gpu_mask)
+    return gpu_mask.download()
+
+def find_edges_and_contours(img_bgr, params, cache=None, cancelled=None):
+    """
+    Build the edge mask for an image.
+    cache: optional dict holding intermediate stages between calls on the same
+    image, so e.g. a Canny change skips the bilateral filter. Clear it when
+    the image changes.
+    cancelled: optional callable polled between stages; once it returns True
+    the run stops with PipelineCancelled (completed stages stay cached).
+    """
+    return _edge_mask(img_bgr, params, cache, cancelled)[0]
+
+def _edge_mask(img_bgr, params, cache, cancelled):
+    """
+    find_edges_and_contours, also returning bitwise_not(mask) when it is
+    available without extra work (else None). The inverse may be a cached
+    stage buffer, so treat it as read-only.
+    """
+    if CUDA_AVAILABLE:
+        return _mask_cuda(img_bgr, params, cache, cancelled), None
+        
+    gray = _cached_stage(cache, "gray", (), _stage_gray, img_bgr)
+    edges, canny_key = _edges_cpu(gray, params, cache, cancelled)
+    _check_cancelled(cancelled)
+    
+    # Thicken edges (cached too, so contour-only changes like gap or
+    # simplify skip it; keyed on the kernel size actually used)
+    thickness = max(1, int(params["edge_thickness"]))
+    thickened_edges = _cached_stage(cache, "dilated", canny_key + (thickness,),
+                                    _stage_dilate, edges, thickness)
     
-    return thickened_edges
+    # The returned mask must be a fresh array: a cached buffer gets
+    # overwritten by later runs while the caller still holds the mask
+    if params["invert"]:
+        # Invert (for silhouette-style output); the dilated edges are then
+        # exactly the inverse contours_from_mask needs
+        return cv2.bitwise_not(thickened_edges), thickened_edges
+    return (thickened_edges if cache is None else thickened_edges.copy()), None
+
+_turbo_jpeg = None
+
+# EXIF orientation tag -> transform to an upright image (cv2.imread does this itself)
+_EXIF_ORIENTATION_FIXES = {
+    2: lambda img: cv2.flip(img, 1),
+    3: lambda img: cv2.rotate(img, cv2.ROTATE_180),
+    4: lambda img: cv2.flip(img, 0),
+    5: lambda img: cv2.transpose(img),
+    6: lambda img: cv2.rotate(img, cv2.ROTATE_90_CLOCKWISE),
+    7: lambda img: cv2.rotate(cv2.transpose(img), cv2.ROTATE_180),
+    8: lambda img: cv2.rotate(img, cv2.ROTATE_90_COUNTERCLOCKWISE),
+}
+
+def read_image(path):
+    """
+    Read an image as BGR (None if unreadable).
+    JPEGs are decoded with libjpeg-turbo when PyTurboJPEG is installed.
+    """
+    global _turbo_jpeg
+    if TURBOJPEG_AVAILABLE and os.path.splitext(path)[1].lower() in (".jpg", ".jpeg"):
+        try:
+            if _turbo_jpeg is None:
+                _turbo_jpeg = TurboJPEG()
+            with open(path, "rb") as f:
+                img = _turbo_jpeg.decode(f.read(), pixel_format=TJPF_BGR)
+            # Match cv2.imread, which rotates phone photos upright
+            with Image.open(path) as pil_img:
+                orientation = pil_img.getexif().get(0x0112, 1)
+            fix = _EXIF_ORIENTATION_FIXES.get(orientation)
+            return fix(img) if fix else img
+        except (OSError, RuntimeError):
+            pass  # Missing libturbojpeg or a file it can't decode
+    return cv2.imread(path, cv2.IMREAD_COLOR)
+
+def _rdp_keep(pts, eps):
+    """
+    Iterative Douglas-Peucker over an (N, 2) float array.
+    Returns a bool mask of the vertices to keep. Written in the subset of
+    Python that Numba compiles (explicit index stack, no recursion).
+    """
+    n = pts.shape[0]
+    keep = np.zeros(n, dtype=np.bool_)
+    keep[0] = True
+    keep[n - 1] = True
+    eps_sq = eps * eps
+
+    stack = np.empty((n, 2), dtype=np.int64)
+    stack[0, 0] = 0
+    stack[0, 1] = n - 1
+    top = 1
+    while top > 0:
+        top -= 1
+        i0 = stack[top, 0]
+        i1 = stack[top, 1]
+        if i1 - i0 < 2:
+            continue
+
+        # Farthest vertex from the chord segment i0 -> i1 (squared distances).
+        # Distance to the segment, not its infinite line: spurs and backtracks
+        # project outside the chord and must still count.
+        x0 = pts[i0, 0]
+        y0 = pts[i0, 1]
+        dx = pts[i1, 0] - x0
+        dy = pts[i1, 1] - y0
+        seg_sq = dx * dx + dy * dy
+        best = -1.0
+        best_i = i0
+        for k in range(i0 + 1, i1):
+            px = pts[k, 0] - x0
+            py = pts[k, 1] - y0
+            t = 0.0
+            if seg_sq > 0:
+                t = min(max((px * dx + py * dy) / seg_sq, 0.0), 1.0)
+            ex = px - t * dx
+            ey = py - t * dy
+            d = ex * ex + ey * ey
+            if d > best:
+                best = d
+                best_i = k
+
+        if best > eps_sq:
+            keep[best_i] = True
+            stack[top, 0] = i0
+            stack[top, 1] = best_i
+            top += 1
+            stack[top, 0] = best_i
+            stack[top, 1] = i1
+            top += 1
+    return keep
+
+if NUMBA_AVAILABLE:
+    # nogil lets simplify_contour run in parallel on a thread pool
+    _rdp_keep = njit(cache=True, nogil=True)(_rdp_keep)
+
+def simplify_contour(contour, eps):
+    """Douglas-Peucker simplify a closed contour (Numba-compiled when available)"""
+    if not NUMBA_AVAILABLE:
+        return cv2.approxPolyDP(contour, eps, True)
+    pts = contour.reshape(-1, 2)
+    # Close the ring so the first split happens at the vertex farthest from the start
+    ring = np.concatenate((pts, pts[:1])).astype(np.float64)
+    keep = _rdp_keep(ring, eps)[:-1]
+    return pts[keep].reshape(-1, 1, 2)
+
+def _canvas_polyline_loop(pts, scale, ox, oy):
+    """
+    Single-pass version of canvas_polyline for Numba: transform, bounding box
+    and duplicate-pixel removal without the NumPy temporaries.
+    """
+    n = pts.shape[0]
+    out = np.empty((n, 2), dtype=np.float64)
+    bbox = np.empty(4, dtype=np.float64)
+    bbox[0] = np.inf
+    bbox[1] = np.inf
+    bbox[2] = -np.inf
+    bbox[3] = -np.inf
+    m = 0
+    prev_px = 0.0
+    prev_py = 0.0
+    for k in range(n):
+        x = pts[k, 0] * scale + ox
+        y = pts[k, 1] * scale + oy
+        bbox[0] = min(bbox[0], x)
+        bbox[1] = min(bbox[1], y)
+        bbox[2] = max(bbox[2], x)
+        bbox[3] = max(bbox[3], y)
+        px = np.rint(x)
+        py = np.rint(y)
+        if k == 0 or px != prev_px or py != prev_py:
+            out[m, 0] = x
+            out[m, 1] = y
+            m += 1
+        prev_px = px
+        prev_py = py
+    return out[:m], bbox
 
-def contours_from_mask(mask, largest_n=3, simplify_pct=0.6, gap_threshold=5.0):
-    # Find external contours only
-    contours, _ = cv2.findContours(255 - mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)  # invert so dark = fill
+if NUMBA_AVAILABLE:
+    _canvas_polyline_loop = njit(cache=True)(_canvas_polyline_loop)
+
+def canvas_polyline(pts, scale, ox, oy):
+    """
+    Map (N, 2) image points to canvas coordinates, dropping vertices that land
+    on the same canvas pixel as their predecessor.
+    Returns (xy, bbox) where bbox = [xmin, ymin, xmax, ymax] over all points.
+    """
+    if NUMBA_AVAILABLE:
+        return _canvas_polyline_loop(pts, float(scale), float(ox), float(oy))
+    xy = pts * scale + (ox, oy)
+    bbox = np.concatenate((xy.min(axis=0), xy.max(axis=0)))
+    px = np.rint(xy)
+    return xy[np.any(np.diff(px, axis=0, prepend=px[:1] - 1) != 0, axis=1)], bbox
+
+def simplify_polyline(xy, eps):
+    """Douglas-Peucker simplify an open (N, 2) float polyline (Numba-compiled when available)"""
+    if len(xy) < 3:
+        return xy
+    if not NUMBA_AVAILABLE:
+        return cv2.approxPolyDP(xy.astype(np.float32), eps, False).reshape(-1, 2)
+    return xy[_rdp_keep(xy, eps)]
+
+def warm_up_jit():
+    """Compile the Numba kernels ahead of the first real contour"""
+    if NUMBA_AVAILABLE:
+        square = np.array([[[0, 0]], [[10, 1]], [[20, 0]], [[10, 10]]], np.int32)
+        simplify_contour(square, 1.0)
+        xy, _ = canvas_polyline(square.reshape(-1, 2), 1.0, 0.0, 0.0)
+        simplify_polyline(xy, 0.5)
+
+def contours_from_mask(mask, largest_n=3, simplify_pct=0.6, gap_threshold=5.0, pool=None,
+                       max_vertices=MAX_CONTOUR_VERTICES, inv=None):
+    """
+    Extract the largest external contours from an edge mask.
+    pool: optional executor used to simplify the contours in parallel.
+    max_vertices: simplify harder (growing epsilon) until each contour has at
+    most this many vertices; None or 0 disables the cap.
+    inv: optional precomputed bitwise_not(mask); it is only read, never written.
+    """
+    # Invert so dark = fill (into a scratch image we may modify)
+    owns_inv = inv is None
+    if owns_inv:
+        inv = cv2.bitwise_not(mask)
+
+    # Apply gap threshold to connect nearby contour segments: close the
+    # mask itself so a single contour pass sees the joined shapes
+    if gap_threshold > 0:
+        kernel = _rect_kernel(max(1, int(gap_threshold)))
+        inv = cv2.morphologyEx(inv, cv2.MORPH_CLOSE, kernel, dst=inv if owns_inv else None)
+
+    # Find external contours only. Tracing the whole mask is cheaper than
+    # prefiltering blobs with connectedComponentsWithStats: edge masks are
+    # thin lines, so bounding boxes are too loose a bound on contour area to
+    # discard anything, and labelling alone costs several findContours passes.
+    contours, _ = cv2.findContours(inv, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
     if not contours:
         return []
 
-    # Keep N largest by area
-    contours = sorted(contours, key=cv2.contourArea, reverse=True)[:max(1, int(largest_n))]
+    # Keep N largest by area (areas computed once; partial sort is enough).
+    # Per-contour cv2.contourArea beats a batched NumPy shoelace here: stacking
+    # thousands of small contours costs more than the calls it saves.
+    largest_n = max(1, int(largest_n))
+    areas = np.fromiter(map(cv2.contourArea, contours), dtype=np.float64, count=len(contours))
+    if len(contours) > largest_n:
+        top = np.argpartition(-areas, largest_n - 1)[:largest_n]
+    else:
+        top = np.arange(len(contours))
+    top = top[np.argsort(-areas[top], kind="stable")]
+    contours = [contours[i] for i in top]
 
-    # Apply gap threshold to connect nearby contour segments
-    if gap_threshold > 0:
-        # Apply gap closing to the entire mask first
-        kernel_size = max(1, int(gap_threshold))
-        kernel = np.ones((kernel_size, kernel_size), np.uint8)
-        
-        # Create a mask from all contours
-        combined_mask = np.zeros(mask.shape, dtype=np.uint8)
-        cv2.drawContours(combined_mask, contours, -1, 255, -1)
-        
-        # Apply morphological closing to close gaps
-        closed_mask = cv2.morphologyEx(combined_mask, cv2.MORPH_CLOSE, kernel)
-        
-        # Find new contours from the gap-closed mask
-        new_contours, _ = cv2.findContours(closed_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
-        if new_contours:
-            # Keep the largest contours
-            new_contours = sorted(new_contours, key=cv2.contourArea, reverse=True)[:max(1, int(largest_n))]
-            contours = new_contours
-
-    if simplify_pct and simplify_pct > 0:
-        h, w = mask.shape[:2]
-        diag = np.sqrt(w*w + h*h)
-        eps = float(simplify_pct) * 0.01 * diag  # percent of diagonal
-        simplified = []
-        for c in contours:
-            approx = cv2.approxPolyDP(c, eps, True)
-            simplified.append(approx if len(approx) >= 3 else c)
-        contours = simplified
+    h, w = mask.shape[:2]
+    diag = np.sqrt(w*w + h*h)
+    eps = float(simplify_pct or 0) * 0.01 * diag  # percent of diagonal
+
+    if eps > 0 or max_vertices:
+        def simplify(c):
+            approx = simplify_contour(c, eps) if eps > 0 else c
+            if len(approx) < 3:
+                approx = c
+            if max_vertices:
+                e = max(eps, 1.0)
+                while len(approx) > max_vertices:
+                    e *= 1.5
+                    approx = simplify_contour(c, e)
+            return approx
+
+        # Contours are independent and OpenCV/Numba release the GIL; for a
+        # handful of contours the dispatch overhead outweighs the parallelism
+        if pool is not None and len(contours) >= 4:
+            contours = list(pool.map(simplify, contours))
+        else:
+            contours = [simplify(c) for c in contours]
 
     return contours
 
+def process_image(img_bgr, params, cache=None, pool=None, cancelled=None):
+    """
+    Run the full edge + contour pipeline and return (mask, contours).
+    pool: optional executor for per-contour work (see contours_from_mask).
+    cancelled: optional callable to abandon the run early (see find_edges_and_contours).
+    """
+    mask, inv = _edge_mask(img_bgr, params, cache, cancelled)
+    _check_cancelled(cancelled)
+    contours = contours_from_mask(mask,
+                                  params["largest_n"],
+                                  params["simplify_pct"],
+                                  params["gap_threshold"],
+                                  pool,
+                                  params.get("max_vertices", MAX_CONTOUR_VERTICES),
+                                  inv)
+    return mask, contours
+
 def export_dxf(contours, out_path, img_size, mm_per_px=0.25):
     h, w = img_size
-    doc = ezdxf.new()
-    msp = doc.modelspace()
-
-    # Image coords have origin top-left, y down.
-    # DXF uses origin bottom-left, y up.
-    # Flip Y and scale to mm.
-    for cnt in contours:
-        pts = []
-        for p in cnt:
-            x = float(p[0][0])
-            y = float(p[0][1])
-            x_mm = x * mm_per_px
-            y_mm = (h - y) * mm_per_px
-            pts.append((x_mm, y_mm))
-        if len(pts) >= 3:
-            msp.add_lwpolyline(pts, close=True)
-
-    doc.saveas(out_path)
+
+    # Stream R12 polylines straight to disk; building an ezdxf document
+    # first spends most of the export time on the in-memory entity graph.
+    with r12writer(out_path) as dxf:
+        # Image coords have origin top-left, y down.
+        # DXF uses origin bottom-left, y up.
+        # Flip Y and scale to mm.
+        for cnt in contours:
+            pts = cnt.reshape(-1, 2).astype(np.float64)
+            if len(pts) >= 3:
+                pts[:, 0] *= mm_per_px
+                pts[:, 1] = (h - pts[:, 1]) * mm_per_px
+                dxf.add_polyline_2d(pts.tolist(), closed=True)
+
+# Preset configurations with explicit numeric values
+_PRESETS = {
+    "Default": {
+        "bilateral_diameter": 9,
+        "bilateral_sigma_color": 75,
+        "gaussian_kernel_size": 5,
+        "canny_lower_threshold": 30,
+        "canny_upper_threshold": 100,
+        "edge_thickness": 2.0,
+        "gap_threshold": 5.0,
+        "largest_n": 10,
+        "simplify_pct": 0.5,
+        "max_vertices": 2000,
+        "mm_per_px": 0.25,
+        "invert": True
+    },
+    "High Detail": {
+        "bilateral_diameter": 6,
+        "bilateral_sigma_color": 60,
+        "gaussian_kernel_size": 3,
+        "canny_lower_threshold": 20,
+        "canny_upper_threshold": 60,
+        "edge_thickness": 1.5,
+        "gap_threshold": 3.0,
+        "largest_n": 15,
+        "simplify_pct": 0.3,
+        "max_vertices": 2000,
+        "mm_per_px": 0.25,
+        "invert": True
+    },
+    "Low Noise": {
+        "bilateral_diameter": 12,
+        "bilateral_sigma_color": 120,
+        "gaussian_kernel_size": 7,
+        "canny_lower_threshold": 50,
+        "canny_upper_threshold": 150,
+        "edge_thickness": 3.0,
+        "gap_threshold": 6.0,
+        "largest_n": 10,
+        "simplify_pct": 0.6,
+        "max_vertices": 2000,
+        "mm_per_px": 0.25,
+        "invert": True
+    },
+    "Strong Edges": {
+        "bilateral_diameter": 8,
+        "bilateral_sigma_color": 40,
+        "gaussian_kernel_size": 5,
+        "canny_lower_threshold": 30,
+        "canny_upper_threshold": 100,
+        "edge_thickness": 5.0,
+        "gap_threshold": 8.0,
+        "largest_n": 3,
+        "simplify_pct": 1.0,
+        "max_vertices": 2000,
+        "mm_per_px": 0.25,
+        "invert": True
+    },
+    "Portrait": {
+        "bilateral_diameter": 6,
+        "bilateral_sigma_color": 60,
+        "gaussian_kernel_size": 3,
+        "canny_lower_threshold": 20,
+        "canny_upper_threshold": 60,
+        "edge_thickness": 1.5,
+        "gap_threshold": 2.0,
+        "largest_n": 5,
+        "simplify_pct": 0.4,
+        "max_vertices": 2000,
+        "mm_per_px": 0.25,
+        "invert": False
+    },
+    "Landscape": {
+        "bilateral_diameter": 9,
+        "bilateral_sigma_color": 90,
+        "gaussian_kernel_size": 5,
+        "canny_lower_threshold": 30,
+        "canny_upper_threshold": 90,
+        "edge_thickness": 2.5,
+        "gap_threshold": 4.0,
+        "largest_n": 20,
+        "simplify_pct": 0.3,
+        "max_vertices": 2000,
+        "mm_per_px": 0.25,
+        "invert": True
+    },
+    "Illustration": {
+        "bilateral_diameter": 5,
+        "bilateral_sigma_color": 25,
+        "gaussian_kernel_size": 3,
+        "canny_lower_threshold": 15,
+        "canny_upper_threshold": 50,
+        "edge_thickness": 2.0,
+        "gap_threshold": 2.0,
+        "largest_n": 10,
+        "simplify_pct": 0.2,
+        "max_vertices": 2000,
+        "mm_per_px": 0.25,
+        "invert": False
+    },
+    "Flat (Neutral)": {
+        "bilateral_diameter": 7,
+        "bilateral_sigma_color": 75,
+        "gaussian_kernel_size": 5,
+        "canny_lower_threshold": 30,
+        "canny_upper_threshold": 100,
+        "edge_thickness": 2.0,
+        "gap_threshold": 0.0,
+        "largest_n": 15,
+        "simplify_pct": 0.0,
+        "max_vertices": 2000,
+        "mm_per_px": 0.25,
+        "invert": True
+    },
+    "Max Fidelity": {
+        "bilateral_diameter": 6,
+        "bilateral_sigma_color": 50,
+        "gaussian_kernel_size": 3,
+        "canny_lower_threshold": 20,
+        "canny_upper_threshold": 70,
+        "edge_thickness": 1.2,
+        "gap_threshold": 4.0,
+        "largest_n": 20,
+        "simplify_pct": 0.2,
+        "max_vertices": 5000,
+        "mm_per_px": 0.10,
+        "invert": True
+    }
+}
+
+# Preset tooltips
+_PRESET_TOOLTIPS = {
+    "Default": "Balanced for general use",
+    "High Detail": "Great for photos with fine textures",
+    "Low Noise": "Reduces grain for high-ISO images",
+    "Strong Edges": "Best for logos and bold artwork",
+    "Portrait": "Flattering for faces and skin tones",
+    "Landscape": "Crisp and vibrant for scenery",
+    "Illustration": "Clean output for digital art",
+    "Flat (Neutral)": "Minimal processing, good for editing later",
+    "Max Fidelity": "Highest quality, slowest processing"
+}
 
 # -------------------------
 # GUI Application
 # -------------------------
 class ImageEmbossGUI:
+    # (Tk variable attribute, preset key) pairs applied by on_preset_change
+    _PRESET_APPLIERS = (
+        ("bilateral_d_var", "bilateral_diameter"),
+        ("bilateral_c_var", "bilateral_sigma_color"),
+        ("gaussian_var", "gaussian_kernel_size"),
+        ("canny_l_var", "canny_lower_threshold"),
+        ("canny_u_var", "canny_upper_threshold"),
+        ("thickness_var", "edge_thickness"),
+        ("gap_var", "gap_threshold"),
+        ("largest_var", "largest_n"),
+        ("simplify_var", "simplify_pct"),
+        ("scale_var", "mm_per_px"),
+        ("invert_var", "invert"),
+    )
+    
+    # Per-slider preset comboboxes: preset var -> {choice: {slider var: value}}
+    _SLIDER_PRESETS = {
+        "bilateral_d_preset_var": {"Small": {"bilateral_d_var": 6},
+                                   "Medium": {"bilateral_d_var": 9},
+                                   "Large": {"bilateral_d_var": 12}},
+        "bilateral_c_preset_var": {"Low": {"bilateral_c_var": 40},
+                                   "Medium": {"bilateral_c_var": 75},
+                                   "High": {"bilateral_c_var": 120}},
+        "gaussian_preset_var": {"Off": {"gaussian_var": 1},
+                                "Light": {"gaussian_var": 3},
+                                "Medium": {"gaussian_var": 5},
+                                "Heavy": {"gaussian_var": 7}},
+        "canny_preset_var": {"Sensitive": {"canny_l_var": 20, "canny_u_var": 60},
+                             "Medium": {"canny_l_var": 30, "canny_u_var": 100},
+                             "Conservative": {"canny_l_var": 50, "canny_u_var": 150}},
+        "thickness_preset_var": {"Thin": {"thickness_var": 1.0},
+                                 "Medium": {"thickness_var": 2.5},
+                                 "Thick": {"thickness_var": 6.0}},
+        "gap_preset_var": {"None": {"gap_var": 0.0},
+                           "Light": {"gap_var": 2.5},
+                           "Medium": {"gap_var": 5.0},
+                           "Heavy": {"gap_var": 10.0}},
+        "largest_preset_var": {"Few": {"largest_var": 3},
+                               "Medium": {"largest_var": 10},
+                               "Many": {"largest_var": 30}},
+        "simplify_preset_var": {"Detailed": {"simplify_var": 0.2},
+                                "Medium": {"simplify_var": 0.5},
+                                "Simple": {"simplify_var": 1.0}},
+        "scale_preset_var": {"Small": {"scale_var": 0.15},
+                             "Medium": {"scale_var": 0.25},
+                             "Large": {"scale_var": 1.0}},
+    }
+    
     def __init__(self):
         # Use TkinterDnD if available, otherwise fall back to regular Tk
         if DRAG_DROP_AVAILABLE:
@@ -212,20 +798,38 @@ class ImageEmbossGUI:
         
         # Data
         self.original_image = None
+        self._input_scale = 1  # Integer factor the loaded image was shrunk by (see MAX_PIXELS)
+        self._source_size = None  # (h, w) of the file as decoded, before any MAX_PIXELS shrink
+        self._orig_display_key = None  # (image id, canvas size) currently displayed
+        self._loading_path = None  # Most recently requested image path
         self.current_mask = None
         self.current_contours = []
         self.image_path = None
         
+        # Background preview pipeline (single worker so results arrive in order)
+        self._pending_update = None
+        self._preview_gen = 0  # Bumped per parameter change; stale runs bail out between stages
+        self._last_run_params = None  # Parameters of the last scheduled preview run
+        self._pipeline_executor = ThreadPoolExecutor(max_workers=1)
+        self._stage_cache = {}  # Intermediate pipeline stages, only touched by the worker
+        self._simplify_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+        self._last_preview_sig = None  # Geometry + canvas size of the last drawn preview
+        self._line_pool = []  # Reusable canvas line items for the preview contours
+        self._line_pool_used = 0  # How many of them are currently visible
+        # Compile the Numba kernels on the worker so the first preview doesn't pay for it
+        self._pipeline_executor.submit(warm_up_jit)
+        
         # Edit mode variables
         self.edit_mode = "view"  # view, paint, eraser, shapes
         self.drawing = False
         self.drawing_points = []
         self.edited_contours = []  # Store manually added contours
         self.erased_contours = set()  # Store indices of erased contours
-        self.erased_points = set()  # Store individual erased points
-        
-        # Store previous slider values for reverting
-        self.previous_slider_values = {}
+        self.erase_mask = None  # Image-sized mask of eraser strokes (255 = erased), made on first use
+        self._has_erasures = None  # Memoized has_erasures(); None until recomputed
+        self._pending_erase_redraw = None  # after_idle job redrawing after a burst of eraser events
+        self.last_erase_x = None  # Canvas position the current eraser stroke continues from
+        self.last_erase_y = None
         
         # Default parameters (matching your previous application)
         self.params = {
@@ -239,143 +843,18 @@ class ImageEmbossGUI:
             "gap_threshold": 5.0,
             "largest_n": 10,
             "simplify_pct": 0.5,
+            "max_vertices": 2000,
             "mm_per_px": 0.25,
             "invert": True  # Default to True to focus on subject
         }
         
-        # Preset configurations with explicit numeric values
-        self.preset_configs = {
-            "Default": {
-                "bilateral_diameter": 9,
-                "bilateral_sigma_color": 75,
-                "gaussian_kernel_size": 5,
-                "canny_lower_threshold": 30,
-                "canny_upper_threshold": 100,
-                "edge_thickness": 2.0,
-                "gap_threshold": 5.0,
-                "largest_n": 10,
-                "simplify_pct": 0.5,
-                "mm_per_px": 0.25,
-                "invert": True
-            },
-            "High Detail": {
-                "bilateral_diameter": 6,
-                "bilateral_sigma_color": 60,
-                "gaussian_kernel_size": 3,
-                "canny_lower_threshold": 20,
-                "canny_upper_threshold": 60,
-                "edge_thickness": 1.5,
-                "gap_threshold": 3.0,
-                "largest_n": 15,
-                "simplify_pct": 0.3,
-                "mm_per_px": 0.25,
-                "invert": True
-            },
-            "Low Noise": {
-                "bilateral_diameter": 12,
-                "bilateral_sigma_color": 120,
-                "gaussian_kernel_size": 7,
-                "canny_lower_threshold": 50,
-                "canny_upper_threshold": 150,
-                "edge_thickness": 3.0,
-                "gap_threshold": 6.0,
-                "largest_n": 10,
-                "simplify_pct": 0.6,
-                "mm_per_px": 0.25,
-                "invert": True
-            },
-            "Strong Edges": {
-                "bilateral_diameter": 8,
-                "bilateral_sigma_color": 40,
-                "gaussian_kernel_size": 5,
-                "canny_lower_threshold": 30,
-                "canny_upper_threshold": 100,
-                "edge_thickness": 5.0,
-                "gap_threshold": 8.0,
-                "largest_n": 3,
-                "simplify_pct": 1.0,
-                "mm_per_px": 0.25,
-                "invert": True
-            },
-            "Portrait": {
-                "bilateral_diameter": 6,
-                "bilateral_sigma_color": 60,
-                "gaussian_kernel_size": 3,
-                "canny_lower_threshold": 20,
-                "canny_upper_threshold": 60,
-                "edge_thickness": 1.5,
-                "gap_threshold": 2.0,
-                "largest_n": 5,
-                "simplify_pct": 0.4,
-                "mm_per_px": 0.25,
-                "invert": False
-            },
-            "Landscape": {
-                "bilateral_diameter": 9,
-                "bilateral_sigma_color": 90,
-                "gaussian_kernel_size": 5,
-                "canny_lower_threshold": 30,
-                "canny_upper_threshold": 90,
-                "edge_thickness": 2.5,
-                "gap_threshold": 4.0,
-                "largest_n": 20,
-                "simplify_pct": 0.3,
-                "mm_per_px": 0.25,
-                "invert": True
-            },
-            "Illustration": {
-                "bilateral_diameter": 5,
-                "bilateral_sigma_color": 25,
-                "gaussian_kernel_size": 3,
-                "canny_lower_threshold": 15,
-                "canny_upper_threshold": 50,
-                "edge_thickness": 2.0,
-                "gap_threshold": 2.0,
-                "largest_n": 10,
-                "simplify_pct": 0.2,
-                "mm_per_px": 0.25,
-                "invert": False
-            },
-            "Flat (Neutral)": {
-                "bilateral_diameter": 7,
-                "bilateral_sigma_color": 75,
-                "gaussian_kernel_size": 5,
-                "canny_lower_threshold": 30,
-                "canny_upper_threshold": 100,
-                "edge_thickness": 2.0,
-                "gap_threshold": 0.0,
-                "largest_n": 15,
-                "simplify_pct": 0.0,
-                "mm_per_px": 0.25,
-                "invert": True
-            },
-            "Max Fidelity": {
-                "bilateral_diameter": 6,
-                "bilateral_sigma_color": 50,
-                "gaussian_kernel_size": 3,
-                "canny_lower_threshold": 20,
-                "canny_upper_threshold": 70,
-                "edge_thickness": 1.2,
-                "gap_threshold": 4.0,
-                "largest_n": 20,
-                "simplify_pct": 0.2,
-                "mm_per_px": 0.10,
-                "invert": True
-            }
-        }
-        
-        # Preset tooltips
-        self.preset_tooltips = {
-            "Default": "Balanced for general use",
-            "High Detail": "Great for photos with fine textures",
-            "Low Noise": "Reduces grain for high-ISO images",
-            "Strong Edges": "Best for logos and bold artwork",
-            "Portrait": "Flattering for faces and skin tones",
-            "Landscape": "Crisp and vibrant for scenery",
-            "Illustration": "Clean output for digital art",
-            "Flat (Neutral)": "Minimal processing, good for editing later",
-            "Max Fidelity": "Highest quality, slowest processing"
-        }
+        # One hidden tooltip window shared by every widget
+        self._tooltip = Toplevel(self.root)
+        self._tooltip.wm_overrideredirect(True)
+        self._tooltip.withdraw()
+        self._tooltip_label = ttk.Label(self._tooltip, background="lightyellow",
+                                        relief="solid", borderwidth=1, padding=5)
+        self._tooltip_label.pack()
         
         self.setup_ui()
         self.setup_drag_drop()
@@ -429,6 +908,7 @@ class ImageEmbossGUI:
         
         self.original_canvas = Canvas(left_frame, bg='white')
         self.original_canvas.pack(fill='both', expand=True)
+        self.original_canvas.bind('<Configure>', lambda e: self.display_original_image())
         
         # Right panel - DXF preview
         right_frame = ttk.LabelFrame(middle_frame, text="DXF Preview")
@@ -513,7 +993,7 @@ class ImageEmbossGUI:
                                        state="readonly", width=15)
         self.preset_combo.pack(side='left', padx=(5, 0))
         self.preset_combo.bind('<<ComboboxSelected>>', lambda e: (
-            self.create_tooltip(self.preset_combo, self.preset_tooltips.get(self.preset_var.get(), "Master preset that coordinates all individual slider presets")),
+            self.create_tooltip(self.preset_combo, _PRESET_TOOLTIPS.get(self.preset_var.get(), "Master preset that coordinates all individual slider presets")),
             self.on_preset_change()
         ))
         
@@ -560,8 +1040,7 @@ class ImageEmbossGUI:
             file_path = files[0]  # Take the first file
             
             # Check if it's an image file
-            image_extensions = ['.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff', '.webp']
-            if any(file_path.lower().endswith(ext) for ext in image_extensions):
+            if os.path.splitext(file_path)[1].lower() in _IMG_EXTS:
                 # Load the image
                 self.load_image_from_path(file_path)
             else:
@@ -572,19 +1051,70 @@ class ImageEmbossGUI:
         
     def load_image_from_path(self, path):
         """Load image from a given path (used by both file dialog and drag-drop)"""
+        # Decode on a background thread; the newest request wins if several overlap
+        self._loading_path = path
+        self.show_loading("Loading image...")
+        
+        def worker():
+            input_scale = 1
+            source_size = None
+            try:
+                image = read_image(path)
+                if image is not None:
+                    h, w = image.shape[:2]
+                    source_size = (h, w)
+                    if h * w > MAX_PIXELS:
+                        input_scale = math.ceil(math.sqrt(h * w / MAX_PIXELS))
+                        image = cv2.resize(image, (w // input_scale, h // input_scale),
+                                           interpolation=cv2.INTER_AREA)
+            except Exception:
+                image = None
+            self.root.after(0, self._finish_load, path, image, input_scale, source_size)
+            
+        threading.Thread(target=worker, daemon=True).start()
+        
+    def _finish_load(self, path, image, input_scale=1, source_size=None):
+        """Install a decoded image (UI thread)"""
+        if path != self._loading_path:
+            return
+        self.hide_loading()
+        
         self.image_path = path
-        self.original_image = cv2.imread(path, cv2.IMREAD_COLOR)
+        self.original_image = image
+        self._input_scale = input_scale
         if self.original_image is not None:
+            # Sizes shown to the user refer to the source photo, not the working copy
+            self._source_size = source_size or self.original_image.shape[:2]
+            # Drop results from the previous image until the worker catches up
+            self.current_mask = None
+            self.current_contours = []
+            # Zoom/pan/resize redraws before the first result would otherwise
+            # draw the old image's contours with the new image's transform
+            self.preview_contours = []
+            self.preview_colors = []
+            self.preview_bounds = []
+            self.clear_dxf_canvas()
+            # Invalidate the cached display
+            self._orig_display_key = None
+            
+            # Clear cached stages on the worker so it can't race a running job
+            self._pipeline_executor.submit(self._stage_cache.clear)
+            self._last_preview_sig = None
+            self._last_run_params = None
+            
             # Reset edit state for new image
             self.edited_contours = []
             self.erased_contours = set()
-            self.erased_points = set()
+            self.erase_mask = None
             self.edit_mode = "view"
             self.dxf_canvas.config(cursor="")
             
             # Update status and dimensions
-            h, w = self.original_image.shape[:2]
-            self.status_label.config(text=f"Loaded: {os.path.basename(path)}")
+            h, w = self._source_size
+            status = f"Loaded: {os.path.basename(path)}"
+            if input_scale > 1:
+                status += f" (downscaled 1/{input_scale} for processing)"
+            self.status_label.config(text=status)
             self.dimensions_label.config(text=f"Size: {w}×{h}px")
             
             # Update output size display
@@ -608,6 +1138,20 @@ class ImageEmbossGUI:
         self.dxf_canvas.bind("<B1-Motion>", self.on_canvas_drag)
         self.dxf_canvas.bind("<ButtonRelease-1>", self.on_canvas_release)
         
+        # Redraw once the canvas settles after a resize
+        self._pending_resize = None
+        self.dxf_canvas.bind("<Configure>", self.on_dxf_canvas_resize)
+        
+    def on_dxf_canvas_resize(self, event):
+        """Debounce canvas resize events into a single redraw"""
+        if self._pending_resize is not None:
+            self.root.after_cancel(self._pending_resize)
+        self._pending_resize = self.root.after(PREVIEW_DEBOUNCE_MS, self._finish_dxf_canvas_resize)
+        
+    def _finish_dxf_canvas_resize(self):
+        self._pending_resize = None
+        self.redraw_preview()
+        
     def zoom_in(self):
         """Zoom in on the preview"""
         self.zoom_factor *= 1.2
@@ -656,6 +1200,10 @@ class ImageEmbossGUI:
             self.start_line_drawing(event.x, event.y)
         elif self.edit_mode == "shapes":
             self.start_shape_drawing(event.x, event.y)
+        elif self.edit_mode == "eraser":
+            # Start a new stroke here rather than joining the previous one
+            self.last_erase_x = event.x
+            self.last_erase_y = event.y
         
     def on_canvas_drag(self, event):
         """Handle canvas drag for panning or drawing"""
@@ -766,33 +1314,32 @@ class ImageEmbossGUI:
             self.dxf_canvas.create_line(self.line_start_x, self.line_start_y, end_x, end_y, 
                                       fill="blue", width=2, tags="temp_line")
             
+    def _canvas_transform(self):
+        """(scale, x offset, y offset) mapping image coordinates onto the DXF canvas"""
+        canvas_width = self.dxf_canvas.winfo_width()
+        canvas_height = self.dxf_canvas.winfo_height()
+        h, w = self.original_image.shape[:2]
+        base_scale = min(canvas_width/w, canvas_height/h, 1.0) * 0.9
+        scale = base_scale * self.zoom_factor
+        center_x = canvas_width//2 + self.pan_x
+        center_y = canvas_height//2 + self.pan_y
+        return scale, center_x - w*scale//2, center_y - h*scale//2
+        
+    def canvas_to_image(self, points):
+        """Convert canvas (x, y) points to an OpenCV-style (N, 1, 2) int32 image contour"""
+        scale, ox, oy = self._canvas_transform()
+        pts = (np.asarray(points, dtype=np.float64).reshape(-1, 2) - (ox, oy)) / scale
+        return pts.astype(np.int32).reshape(-1, 1, 2)
+        
     def finish_paint_stroke(self):
         """Finish a paint stroke and add it to contours"""
         if self.original_image is None:
             return
             
         if len(self.drawing_points) >= 2:
-            # Convert canvas coordinates to image coordinates
-            image_points = []
-            canvas_width = self.dxf_canvas.winfo_width()
-            canvas_height = self.dxf_canvas.winfo_height()
-            h, w = self.original_image.shape[:2]
-            base_scale = min(canvas_width/w, canvas_height/h, 1.0) * 0.9
-            scale = base_scale * self.zoom_factor
-            center_x = canvas_width//2 + self.pan_x
-            center_y = canvas_height//2 + self.pan_y
-            
-            for x, y in self.drawing_points:
-                # Convert back to image coordinates
-                img_x = (x - center_x + w*scale//2) / scale
-                img_y = (y - center_y + h*scale//2) / scale
-                image_points.append([[int(img_x), int(img_y)]])
-            
-            # Add as new contour
-            if len(image_points) >= 2:
-                new_contour = np.array(image_points, dtype=np.int32)
-                self.edited_contours.append(new_contour)
-                self.redraw_preview()
+            # Convert canvas coordinates to image coordinates and add as new contour
+            self.edited_contours.append(self.canvas_to_image(self.drawing_points))
+            self.redraw_preview()
         
         self.drawing = False
         self.drawing_points = []
@@ -812,31 +1359,10 @@ class ImageEmbossGUI:
         if not self.drawing:
             return
             
-        # Create line points
-        line_points = [
-            [[self.line_start_x, self.line_start_y]],
-            [[x, y]]
-        ]
-        
-        # Convert to image coordinates and add as contour
-        image_points = []
-        canvas_width = self.dxf_canvas.winfo_width()
-        canvas_height = self.dxf_canvas.winfo_height()
-        h, w = self.original_image.shape[:2]
-        base_scale = min(canvas_width/w, canvas_height/h, 1.0) * 0.9
-        scale = base_scale * self.zoom_factor
-        center_x = canvas_width//2 + self.pan_x
-        center_y = canvas_height//2 + self.pan_y
-        
-        for point in line_points:
-            img_x = (point[0][0] - center_x + w*scale//2) / scale
-            img_y = (point[0][1] - center_y + h*scale//2) / scale
-            image_points.append([[int(img_x), int(img_y)]])
-        
-        if len(image_points) >= 2:
-            new_contour = np.array(image_points, dtype=np.int32)
-            self.edited_contours.append(new_contour)
-            self.redraw_preview()
+        # Convert the line to image coordinates and add as contour
+        line_points = [(self.line_start_x, self.line_start_y), (x, y)]
+        self.edited_contours.append(self.canvas_to_image(line_points))
+        self.redraw_preview()
             
         self.drawing = False
         self.dxf_canvas.delete("temp_line")
@@ -846,74 +1372,60 @@ class ImageEmbossGUI:
         if self.original_image is None:
             return
             
-        if not hasattr(self, 'last_erase_x'):
+        if self.last_erase_x is None:
             self.last_erase_x = x
             self.last_erase_y = y
             return
             
-        # Create a mask for the eraser path
-        canvas_width = self.dxf_canvas.winfo_width()
-        canvas_height = self.dxf_canvas.winfo_height()
-        h, w = self.original_image.shape[:2]
-        base_scale = min(canvas_width/w, canvas_height/h, 1.0) * 0.9
-        scale = base_scale * self.zoom_factor
-        center_x = canvas_width//2 + self.pan_x
-        center_y = canvas_height//2 + self.pan_y
-        
-        # Convert canvas coordinates to image coordinates
-        img_x1 = (self.last_erase_x - center_x + w*scale//2) / scale
-        img_y1 = (self.last_erase_y - center_y + h*scale//2) / scale
-        img_x2 = (x - center_x + w*scale//2) / scale
-        img_y2 = (y - center_y + h*scale//2) / scale
+        # Convert the drag segment to image coordinates
+        scale, ox, oy = self._canvas_transform()
+        img_x1 = (self.last_erase_x - ox) / scale
+        img_y1 = (self.last_erase_y - oy) / scale
+        img_x2 = (x - ox) / scale
+        img_y2 = (y - oy) / scale
         
         # Erase radius in image coordinates
         erase_radius_img = self.eraser_radius / scale
         
-        # Mark points within eraser radius as erased
-        for i, contour in enumerate(self.preview_contours):
-            if i in self.erased_contours:
-                continue
-                
-            # Check each point in the contour
-            for j, point in enumerate(contour):
-                px, py = float(point[0][0]), float(point[0][1])
-                
-                # Check if point is within eraser radius of the line segment
-                distance = self.point_to_line_distance(px, py, img_x1, img_y1, img_x2, img_y2)
-                if distance < erase_radius_img:
-                    # Mark this point as erased by adding to a set of erased points
-                    if not hasattr(self, 'erased_points'):
-                        self.erased_points = set()
-                    self.erased_points.add((i, j))
+        # Paint the segment into the erase mask; a thick line with round caps
+        # covers every point within the eraser radius of the drag path
+        if self.erase_mask is None:
+            self.erase_mask = np.zeros(self.original_image.shape[:2], dtype=np.uint8)
+        cv2.line(self.erase_mask, (round(img_x1), round(img_y1)), (round(img_x2), round(img_y2)),
+                 255, thickness=max(1, round(2 * erase_radius_img)))
+        self._has_erasures = None
         
         self.last_erase_x = x
         self.last_erase_y = y
-        self.redraw_preview()
-        
-    def point_to_line_distance(self, px, py, x1, y1, x2, y2):
-        """Calculate distance from point to line segment"""
-        # Vector from line start to end
-        line_dx = x2 - x1
-        line_dy = y2 - y1
-        line_length_sq = line_dx * line_dx + line_dy * line_dy
-        
-        if line_length_sq == 0:
-            # Line is a point
-            return ((px - x1) ** 2 + (py - y1) ** 2) ** 0.5
         
-        # Vector from line start to point
-        point_dx = px - x1
-        point_dy = py - y1
+        # Every segment goes into the mask, but the redraw waits until Tk has
+        # drained the queued motion events so a fast drag redraws once
+        if self._pending_erase_redraw is None:
+            self._pending_erase_redraw = self.root.after_idle(self._flush_erase_redraw)
         
-        # Project point onto line
-        t = max(0, min(1, (point_dx * line_dx + point_dy * line_dy) / line_length_sq))
-        
-        # Closest point on line segment
-        closest_x = x1 + t * line_dx
-        closest_y = y1 + t * line_dy
+    def _flush_erase_redraw(self):
+        """Redraw the preview once for all eraser segments since the last redraw"""
+        self._pending_erase_redraw = None
+        self.redraw_preview()
         
-        # Distance from point to closest point on line
-        return ((px - closest_x) ** 2 + (py - closest_y) ** 2) ** 0.5
+    def kept_points(self, contour):
+        """Points of a detected contour not covered by the eraser, as an (N, 2) array"""
+        pts = contour.reshape(-1, 2)
+        if self.erase_mask is None:
+            return pts
+        h, w = self.erase_mask.shape
+        erased = self.erase_mask[np.clip(pts[:, 1], 0, h - 1), np.clip(pts[:, 0], 0, w - 1)]
+        return pts[erased == 0]
+        
+    def has_erasures(self):
+        """Check if the eraser has removed any point of the displayed contours"""
+        if self.erase_mask is None or not hasattr(self, 'preview_contours'):
+            return False
+        # Asked on every slider tick (via has_edits), so only rescan after a
+        # stroke or a new contour set
+        if self._has_erasures is None:
+            self._has_erasures = any(len(self.kept_points(c)) < len(c) for c in self.preview_contours)
+        return self._has_erasures
                     
     def start_shape_drawing(self, x, y):
         """Start drawing a shape"""
@@ -963,34 +1475,15 @@ class ImageEmbossGUI:
             
             # Generate circle points
             num_points = 16
-            shape_points = []
-            for i in range(num_points):
-                angle = 2 * math.pi * i / num_points
-                px = center_x + radius * math.cos(angle)
-                py = center_y + radius * math.sin(angle)
-                shape_points.append([[px, py]])
+            angles = np.linspace(0, 2 * np.pi, num_points, endpoint=False)
+            shape_points = np.column_stack((center_x + radius * np.cos(angles),
+                                            center_y + radius * np.sin(angles)))
             # Close the circle by adding the first point again
-            shape_points.append([[center_x + radius, center_y]])
+            shape_points = np.vstack((shape_points, shape_points[:1]))
         
         # Convert to image coordinates and add as contour
-        image_points = []
-        canvas_width = self.dxf_canvas.winfo_width()
-        canvas_height = self.dxf_canvas.winfo_height()
-        h, w = self.original_image.shape[:2]
-        base_scale = min(canvas_width/w, canvas_height/h, 1.0) * 0.9
-        scale = base_scale * self.zoom_factor
-        center_x = canvas_width//2 + self.pan_x
-        center_y = canvas_height//2 + self.pan_y
-        
-        for point in shape_points:
-            img_x = (point[0][0] - center_x + w*scale//2) / scale
-            img_y = (point[0][1] - center_y + h*scale//2) / scale
-            image_points.append([[int(img_x), int(img_y)]])
-        
-        if len(image_points) >= 3:
-            new_contour = np.array(image_points, dtype=np.int32)
-            self.edited_contours.append(new_contour)
-            self.redraw_preview()
+        self.edited_contours.append(self.canvas_to_image(shape_points))
+        self.redraw_preview()
             
         self.drawing = False
             
@@ -1022,48 +1515,16 @@ class ImageEmbossGUI:
             self.loading_frame = None
             self.loading_label = None
             
-    def apply_gap_processing(self):
-        """Apply gap processing with loading feedback"""
-        if self.original_image is None:
-            messagebox.showwarning("Warning", "No image loaded.")
-            return
-            
-        self.show_loading("Applying gap processing...")
-        
-        try:
-            # Update gap threshold parameter
-            self.params["gap_threshold"] = self.gap_var.get()
-            self.gap_label.config(text=f"{self.params['gap_threshold']:.1f}")
-            
-            # Process contours with gap threshold
-            self.current_contours = contours_from_mask(self.current_mask, 
-                                                     self.params["largest_n"], 
-                                                     self.params["simplify_pct"],
-                                                     self.params["gap_threshold"])
-            
-            # Update preview
-            self.display_dxf_preview()
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Gap processing failed: {str(e)}")
-        finally:
-            self.hide_loading()
-        
     def create_tooltip(self, widget, text):
         """Create a tooltip for a widget"""
         def show_tooltip(event):
-            tooltip = Tk()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            label = ttk.Label(tooltip, text=text, background="lightyellow", 
-                            relief="solid", borderwidth=1, padding=5)
-            label.pack()
-            widget.tooltip = tooltip
+            self._tooltip_label.config(text=text)
+            self._tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+            self._tooltip.deiconify()
+            self._tooltip.lift()
             
         def hide_tooltip(event):
-            if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
-                del widget.tooltip
+            self._tooltip.withdraw()
                 
         widget.bind("<Enter>", show_tooltip)
         widget.bind("<Leave>", hide_tooltip)
@@ -1080,7 +1541,7 @@ class ImageEmbossGUI:
         bilateral_d_preset_combo = ttk.Combobox(bilateral_d_preset_frame, textvariable=self.bilateral_d_preset_var,
                                               values=["Small", "Medium", "Large"], state="readonly", width=8)
         bilateral_d_preset_combo.pack(side='left')
-        bilateral_d_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_bilateral_d_preset_change())
+        bilateral_d_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_slider_preset_change("bilateral_d_preset_var"))
         self.create_tooltip(bilateral_d_preset_combo, "Bilateral diameter presets: Small(6), Medium(9), Large(12)")
         
         bilateral_d_label = ttk.Label(bilateral_d_frame, text="Bilateral Diameter:", width=15)
@@ -1106,7 +1567,7 @@ class ImageEmbossGUI:
         bilateral_c_preset_combo = ttk.Combobox(bilateral_c_preset_frame, textvariable=self.bilateral_c_preset_var,
                                               values=["Low", "Medium", "High"], state="readonly", width=8)
         bilateral_c_preset_combo.pack(side='left')
-        bilateral_c_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_bilateral_c_preset_change())
+        bilateral_c_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_slider_preset_change("bilateral_c_preset_var"))
         self.create_tooltip(bilateral_c_preset_combo, "Bilateral color presets: Low(40), Medium(75), High(120)")
         
         bilateral_c_label = ttk.Label(bilateral_c_frame, text="Bilateral Color σ:", width=15)
@@ -1130,17 +1591,17 @@ class ImageEmbossGUI:
         gaussian_preset_frame.pack(side='left')
         self.gaussian_preset_var = StringVar(value="Medium")
         gaussian_preset_combo = ttk.Combobox(gaussian_preset_frame, textvariable=self.gaussian_preset_var,
-                                           values=["Light", "Medium", "Heavy"], state="readonly", width=8)
+                                           values=["Off", "Light", "Medium", "Heavy"], state="readonly", width=8)
         gaussian_preset_combo.pack(side='left')
-        gaussian_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_gaussian_preset_change())
-        self.create_tooltip(gaussian_preset_combo, "Gaussian blur presets: Light(3), Medium(5), Heavy(7)")
+        gaussian_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_slider_preset_change("gaussian_preset_var"))
+        self.create_tooltip(gaussian_preset_combo, "Gaussian blur presets: Off(1), Light(3), Medium(5), Heavy(7)")
         
         gaussian_label = ttk.Label(gaussian_frame, text="Gaussian Kernel:", width=15)
         gaussian_label.pack(side='left', padx=(5, 0))
-        self.create_tooltip(gaussian_label, "Controls the amount of blur applied. Larger values create more smoothing. Must be odd numbers. Range: 3-9")
+        self.create_tooltip(gaussian_label, "Controls the amount of blur applied. Larger values create more smoothing. Must be odd numbers. Range: 1-9 (1 = off)")
         
         self.gaussian_var = IntVar(value=5)
-        self.gaussian_scale = ttk.Scale(gaussian_frame, from_=3, to=9, 
+        self.gaussian_scale = ttk.Scale(gaussian_frame, from_=1, to=9, 
                                       variable=self.gaussian_var, orient='horizontal',
                                       command=self.on_slider_start_change)
         self.gaussian_scale.pack(side='left', fill='x', expand=True, padx=(5, 0))
@@ -1159,7 +1620,7 @@ class ImageEmbossGUI:
         canny_preset_combo = ttk.Combobox(canny_preset_combo_frame, textvariable=self.canny_preset_var,
                                         values=["Sensitive", "Medium", "Conservative"], state="readonly", width=10)
         canny_preset_combo.pack(side='left')
-        canny_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_canny_preset_change())
+        canny_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_slider_preset_change("canny_preset_var"))
         self.create_tooltip(canny_preset_combo, "Canny edge presets: Sensitive(20/60), Medium(30/100), Conservative(50/150)")
         
         ttk.Label(canny_preset_frame, text="Canny Edge Detection", width=20).pack(side='left', padx=(5, 0))
@@ -1205,7 +1666,7 @@ class ImageEmbossGUI:
         thickness_preset_combo = ttk.Combobox(thickness_preset_frame, textvariable=self.thickness_preset_var,
                                             values=["Thin", "Medium", "Thick"], state="readonly", width=8)
         thickness_preset_combo.pack(side='left')
-        thickness_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_thickness_preset_change())
+        thickness_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_slider_preset_change("thickness_preset_var"))
         self.create_tooltip(thickness_preset_combo, "Edge thickness presets: Thin(1.0), Medium(2.5), Thick(6.0)")
         
         thickness_label = ttk.Label(thickness_frame, text="Edge Thickness:", width=15)
@@ -1231,7 +1692,7 @@ class ImageEmbossGUI:
         gap_preset_combo = ttk.Combobox(gap_preset_frame, textvariable=self.gap_preset_var,
                                       values=["None", "Light", "Medium", "Heavy"], state="readonly", width=8)
         gap_preset_combo.pack(side='left')
-        gap_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_gap_preset_change())
+        gap_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_slider_preset_change("gap_preset_var"))
         self.create_tooltip(gap_preset_combo, "Gap closing presets: None(0), Light(2.5), Medium(5.0), Heavy(10.0)")
         
         gap_label = ttk.Label(gap_frame, text="Gap Threshold:", width=15)
@@ -1257,7 +1718,7 @@ class ImageEmbossGUI:
         largest_preset_combo = ttk.Combobox(largest_preset_frame, textvariable=self.largest_preset_var,
                                          values=["Few", "Medium", "Many"], state="readonly", width=8)
         largest_preset_combo.pack(side='left')
-        largest_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_largest_preset_change())
+        largest_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_slider_preset_change("largest_preset_var"))
         self.create_tooltip(largest_preset_combo, "Contour count presets: Few(3), Medium(10), Many(30)")
         
         largest_label = ttk.Label(largest_frame, text="Largest N:", width=15)
@@ -1283,7 +1744,7 @@ class ImageEmbossGUI:
         simplify_preset_combo = ttk.Combobox(simplify_preset_frame, textvariable=self.simplify_preset_var,
                                            values=["Detailed", "Medium", "Simple"], state="readonly", width=8)
         simplify_preset_combo.pack(side='left')
-        simplify_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_simplify_preset_change())
+        simplify_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_slider_preset_change("simplify_preset_var"))
         self.create_tooltip(simplify_preset_combo, "Simplification presets: Detailed(0.2), Medium(0.5), Simple(1.0)")
         
         simplify_label = ttk.Label(simplify_frame, text="Simplify %:", width=15)
@@ -1309,7 +1770,7 @@ class ImageEmbossGUI:
         scale_preset_combo = ttk.Combobox(scale_preset_frame, textvariable=self.scale_preset_var,
                                         values=["Small", "Medium", "Large"], state="readonly", width=8)
         scale_preset_combo.pack(side='left')
-        scale_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_scale_preset_change())
+        scale_preset_combo.bind('<<ComboboxSelected>>', lambda e: self.on_slider_preset_change("scale_preset_var"))
         self.create_tooltip(scale_preset_combo, "Scale presets: Small(0.15), Medium(0.25), Large(1.0)")
         
         scale_label = ttk.Label(scale_frame, text="Scale (mm/px):", width=15)
@@ -1338,7 +1799,8 @@ class ImageEmbossGUI:
             ("Images", "*.jpg;*.jpeg;*.png;*.bmp;*.tif;*.tiff;*.webp"),
             ("All files", "*.*"),
         ]
-        path = filedialog.askopenfilename(title="Select an image to convert", filetypes=filetypes)
+        path = filedialog.askopenfilename(title="Select an image to convert", filetypes=filetypes,
+                                          parent=self.root)
         if path:
             self.load_image_from_path(path)
                 
@@ -1346,44 +1808,61 @@ class ImageEmbossGUI:
         if self.original_image is None:
             return
             
-        # Convert BGR to RGB for display
-        img_rgb = cv2.cvtColor(self.original_image, cv2.COLOR_BGR2RGB)
-        
         # Resize to fit canvas while maintaining aspect ratio
         canvas_width = self.original_canvas.winfo_width()
         canvas_height = self.original_canvas.winfo_height()
         
         if canvas_width > 1 and canvas_height > 1:
-            h, w = img_rgb.shape[:2]
+            # Already showing this image at this canvas size
+            display_key = (id(self.original_image), canvas_width, canvas_height)
+            if display_key == self._orig_display_key:
+                return
+            self._orig_display_key = display_key
+            
+            h, w = self.original_image.shape[:2]
             scale = min(canvas_width/w, canvas_height/h, 1.0)
             new_w, new_h = int(w*scale), int(h*scale)
             
-            img_resized = cv2.resize(img_rgb, (new_w, new_h))
-            self.original_photo = ImageTk.PhotoImage(Image.fromarray(img_resized))
+            # Resize first, then convert BGR to RGB on the small image only
+            img_resized = cv2.resize(self.original_image, (new_w, new_h))
+            img_rgb = cv2.cvtColor(img_resized, cv2.COLOR_BGR2RGB, dst=img_resized)
+            photo = getattr(self, 'original_photo', None)
+            if photo is not None and (photo.width(), photo.height()) == (new_w, new_h):
+                # Same display size (e.g. the next photo from the same camera):
+                # refill the existing Tk image instead of allocating a new one
+                photo.paste(Image.fromarray(img_rgb))
+            else:
+                self.original_photo = ImageTk.PhotoImage(Image.fromarray(img_rgb))
             
             self.original_canvas.delete("all")
             self.original_canvas.create_image(canvas_width//2, canvas_height//2, 
                                             image=self.original_photo, anchor='center')
     
+    def _slider_params(self):
+        """Pipeline parameters as currently set by the sliders (self.params is left alone)"""
+        params = dict(self.params)
+        params["bilateral_diameter"] = int(self.bilateral_d_var.get())
+        params["bilateral_sigma_color"] = int(self.bilateral_c_var.get())
+        params["bilateral_sigma_space"] = int(self.bilateral_c_var.get())  # Use same as color for simplicity
+        params["gaussian_kernel_size"] = int(self.gaussian_var.get())
+        if params["gaussian_kernel_size"] % 2 == 0:
+            params["gaussian_kernel_size"] += 1  # Ensure odd
+        params["canny_lower_threshold"] = int(self.canny_l_var.get())
+        params["canny_upper_threshold"] = int(self.canny_u_var.get())
+        params["edge_thickness"] = self.thickness_var.get()
+        params["gap_threshold"] = self.gap_var.get()
+        params["largest_n"] = int(self.largest_var.get())
+        params["simplify_pct"] = self.simplify_var.get()
+        params["mm_per_px"] = self.scale_var.get()
+        params["invert"] = self.invert_var.get()
+        return params
+        
     def update_preview(self):
         if self.original_image is None:
             return
             
         # Update parameters from sliders
-        self.params["bilateral_diameter"] = int(self.bilateral_d_var.get())
-        self.params["bilateral_sigma_color"] = int(self.bilateral_c_var.get())
-        self.params["bilateral_sigma_space"] = int(self.bilateral_c_var.get())  # Use same as color for simplicity
-        self.params["gaussian_kernel_size"] = int(self.gaussian_var.get())
-        if self.params["gaussian_kernel_size"] % 2 == 0:
-            self.params["gaussian_kernel_size"] += 1  # Ensure odd
-        self.params["canny_lower_threshold"] = int(self.canny_l_var.get())
-        self.params["canny_upper_threshold"] = int(self.canny_u_var.get())
-        self.params["edge_thickness"] = self.thickness_var.get()
-        self.params["gap_threshold"] = self.gap_var.get()
-        self.params["largest_n"] = int(self.largest_var.get())
-        self.params["simplify_pct"] = self.simplify_var.get()
-        self.params["mm_per_px"] = self.scale_var.get()
-        self.params["invert"] = self.invert_var.get()
+        self.params = self._slider_params()
         
         # Update labels
         self.bilateral_d_label.config(text=str(self.params["bilateral_diameter"]))
@@ -1397,90 +1876,186 @@ class ImageEmbossGUI:
         self.simplify_label.config(text=f"{self.params['simplify_pct']:.1f}")
         self.scale_label.config(text=f"{self.params['mm_per_px']:.3f}")
         
-        # Process image with gap processing for preview
-        self.current_mask = find_edges_and_contours(self.original_image, self.params)
-        self.current_contours = contours_from_mask(self.current_mask, 
-                                                 self.params["largest_n"], 
-                                                 self.params["simplify_pct"],
-                                                 self.params["gap_threshold"])
-        
-        # Display DXF preview
+        # Slider ticks that round to the values already scheduled need no new run
+        if self.params == self._last_run_params:
+            return
+        self._last_run_params = dict(self.params)
+        
+        # Process image off the UI thread once the sliders settle
+        self._schedule_update()
+        
+    def _schedule_update(self):
+        """
+        Debounce pipeline runs so a slider drag only processes the final value.
+        Every parameter path (slider ticks, per-slider and master presets) ends
+        here via update_preview, so only the cheap label refresh runs per event.
+        """
+        if self._pending_update is not None:
+            self.root.after_cancel(self._pending_update)
+        # Let a run that is already in flight stop at its next stage boundary
+        self._preview_gen += 1
+        self._pending_update = self.root.after(PREVIEW_DEBOUNCE_MS, self._launch_worker)
+        
+    def _launch_worker(self):
+        """Submit the pipeline to the worker thread with a snapshot of the parameters"""
+        self._pending_update = None
+        if self.original_image is None:
+            return
+            
+        # The preview runs on the same working image and exact filters as the
+        # export, so the sliders are tuned against the geometry that gets written
+        # (a downsampled preview drifts: e.g. edge_thickness rounds to no dilation)
+        image = self.original_image
+        gen = self._preview_gen
+        future = self._pipeline_executor.submit(process_image, image, dict(self.params),
+                                                self._stage_cache, self._simplify_pool,
+                                                lambda: gen != self._preview_gen)
+        future.add_done_callback(lambda f: self.root.after(0, self._apply_result, image, f))
+        
+    def _apply_result(self, image, future):
+        """Store the worker's mask/contours and refresh the preview (UI thread)"""
+        # Ignore results computed for an image that has since been replaced
+        if image is not self.original_image:
+            return
+            
+        try:
+            self.current_mask, self.current_contours = future.result()
+        except PipelineCancelled:
+            return
+        except Exception as e:
+            messagebox.showerror("Error", f"Processing failed: {str(e)}")
+            return
+            
         self.display_dxf_preview()
         
     def display_dxf_preview(self):
         if not self.current_contours or self.original_image is None:
-            self.dxf_canvas.delete("all")
+            self._last_preview_sig = None
+            self.clear_dxf_canvas()
             return
             
-        # Store contours for redrawing
+        # Skip the redraw if the new contours look exactly like the drawn ones
+        # (e.g. only the mm/px scale changed)
+        signature = hash((tuple(c.tobytes() for c in self.current_contours),
+                          self.dxf_canvas.winfo_width(), self.dxf_canvas.winfo_height()))
+        if signature == self._last_preview_sig:
+            return
+        self._last_preview_sig = signature
+            
+        # Store contours for redrawing, classified once here rather than on
+        # every zoom/pan/edit redraw: dark green for meaningful contours,
+        # red for noise/small contours
+        if self.erase_mask is not None and not self.has_erasures():
+            # Strokes that missed every contour are not edits (no prompt guarded
+            # this change), so they must not cut into the new contour set
+            self.erase_mask = None
         self.preview_contours = self.current_contours
+        self._has_erasures = None
+        self.preview_colors = ['dark green' if cv2.contourArea(c) > 100 else 'red'
+                               for c in self.preview_contours]
+        # Image-space (x, y, w, h) boxes let zoomed-in redraws skip off-screen
+        # contours before touching their points
+        self.preview_bounds = [cv2.boundingRect(c) for c in self.preview_contours]
         self.redraw_preview()
         
+    def clear_dxf_canvas(self):
+        """Delete every item on the preview canvas, including the line pool"""
+        self.dxf_canvas.delete("all")
+        self._line_pool = []
+        self._line_pool_used = 0
+        
     def redraw_preview(self):
         """Redraw the preview with current zoom and pan settings"""
         if not hasattr(self, 'preview_contours') or not self.preview_contours or self.original_image is None:
-            self.dxf_canvas.delete("all")
+            self.clear_dxf_canvas()
             return
 
-        # Clear canvas
-        self.dxf_canvas.delete("all")
-        
         # Get canvas dimensions
         canvas_width = self.dxf_canvas.winfo_width()
         canvas_height = self.dxf_canvas.winfo_height()
         
         if canvas_width <= 1 or canvas_height <= 1:
+            self.clear_dxf_canvas()
             return
+            
+        # Clear everything except the pooled contour lines, which are updated
+        # in place below (cheaper than deleting and recreating canvas items).
+        # Contours stay vector items rather than being rasterized into one
+        # PhotoImage: there are at most largest_n of them, already culled and
+        # simplified to canvas resolution, so a full-canvas image rebuild on
+        # every zoom/pan would cost more than the few Tcl calls it replaces.
+        self.dxf_canvas.delete("!contour")
+        pool = self._line_pool
+        used = 0
+        
+        def draw_line(coords, color):
+            # coords is a flat list of Python floats: tkinter only flattens
+            # lists/tuples (an array.array would reach Tcl as one object), and
+            # a tuple converts no faster than the list from ndarray.tolist()
+            nonlocal used
+            if used < len(pool):
+                self.dxf_canvas.coords(pool[used], coords)
+                self.dxf_canvas.itemconfigure(pool[used], fill=color, width=line_width,
+                                              state='normal')
+            else:
+                pool.append(self.dxf_canvas.create_line(coords, fill=color, width=line_width,
+                                                        tags="contour"))
+            used += 1
 
-        # Calculate base scale to fit contours in canvas
-        h, w = self.original_image.shape[:2]
-        base_scale = min(canvas_width/w, canvas_height/h, 1.0) * 0.9
+        # Fit-to-canvas scale with zoom, offset by the pan
+        scale, ox, oy = self._canvas_transform()
         
-        # Apply zoom factor
-        scale = base_scale * self.zoom_factor
+        # Adjust line width based on zoom
+        line_width = max(1, int(2 * self.zoom_factor))
         
-        # Calculate center position with pan offset
-        center_x = canvas_width//2 + self.pan_x
-        center_y = canvas_height//2 + self.pan_y
+        def to_canvas(pts):
+            """Image (N, 2) points -> flat [x0, y0, x1, y1, ...] canvas coordinates"""
+            return (pts * scale + (ox, oy)).ravel().tolist()
         
         # Draw original contours (excluding erased points)
-        for i, contour in enumerate(self.preview_contours):
+        for i, (contour, color, (bx, by, bw, bh)) in enumerate(
+                zip(self.preview_contours, self.preview_colors, self.preview_bounds)):
             if i in self.erased_contours:
                 continue
+            if (bx * scale + ox > canvas_width or by * scale + oy > canvas_height
+                    or (bx + bw) * scale + ox < 0 or (by + bh) * scale + oy < 0):
+                continue
                 
-            points = []
-            for j, point in enumerate(contour):
-                # Skip erased points
-                if hasattr(self, 'erased_points') and (i, j) in self.erased_points:
-                    continue
-                    
-                x = float(point[0][0]) * scale + center_x - w*scale//2
-                y = float(point[0][1]) * scale + center_y - h*scale//2
-                points.extend([x, y])
-            
-            if len(points) >= 6:  # At least 3 points (x,y pairs)
-                # Use dark green for meaningful contours, red for noise/small contours
-                area = cv2.contourArea(contour)
-                color = 'dark green' if area > 100 else 'red'
-                # Adjust line width based on zoom
-                line_width = max(1, int(2 * self.zoom_factor))
-                # Draw as line instead of polygon to avoid auto-completion
-                self.dxf_canvas.create_line(points, fill=color, width=line_width)
+            pts = self.kept_points(contour)
+            if len(pts) < 3:
+                continue
+                
+            # Skip contours that fall outside the canvas or shrink below a pixel
+            xy, (xmin, ymin, xmax, ymax) = canvas_polyline(pts, scale, ox, oy)
+            if (xmax < 0 or ymax < 0 or xmin > canvas_width or ymin > canvas_height
+                    or max(xmax - xmin, ymax - ymin) < 1 or len(xy) < 2):
+                continue
+                
+            # Half a canvas pixel of simplification is invisible but trims the
+            # segments Tk has to draw when simplify_pct is low or zoomed out
+            xy = simplify_polyline(xy, 0.5)
+                
+            # Draw as line instead of polygon to avoid auto-completion
+            draw_line(xy.ravel().tolist(), color)
         
         # Draw edited contours (manually added)
         for contour in self.edited_contours:
-            points = []
-            for point in contour:
-                x = float(point[0][0]) * scale + center_x - w*scale//2
-                y = float(point[0][1]) * scale + center_y - h*scale//2
-                points.extend([x, y])
-            
-            if len(points) >= 6:  # At least 3 points (x,y pairs)
+            pts = contour.reshape(-1, 2)
+            if len(pts) >= 3:
                 # Use blue for manually added contours
-                line_width = max(1, int(2 * self.zoom_factor))
-                self.dxf_canvas.create_line(points, fill='blue', width=line_width)
+                draw_line(to_canvas(pts), 'blue')
+        
+        # Hide pool items left over from a redraw that drew more lines
+        for item in pool[used:self._line_pool_used]:
+            self.dxf_canvas.itemconfigure(item, state='hidden')
+        self._line_pool_used = used
     
     def on_param_change(self, event=None):
+        # Slider ticks that round to the parameters already in use change
+        # nothing, so they must neither prompt about edits nor clear them
+        if self.original_image is not None and self._slider_params() == self._last_run_params:
+            return
+            
         # Check if user has made edits
         if self.has_edits():
             result = messagebox.askyesnocancel(
@@ -1500,6 +2075,7 @@ class ImageEmbossGUI:
                 return
             # If result is True (Yes), clear edits and continue with parameter change
             self.clear_edits()
+            self.redraw_preview()  # Drop the edits from the canvas now, not when the run lands
         
         # Set preset to Custom when user manually changes parameters
         if self.preset_var.get() != "Custom":
@@ -1508,13 +2084,15 @@ class ImageEmbossGUI:
     
     def has_edits(self):
         """Check if user has made any edits"""
-        return len(self.edited_contours) > 0 or len(self.erased_contours) > 0 or len(self.erased_points) > 0
+        return len(self.edited_contours) > 0 or len(self.erased_contours) > 0 or self.has_erasures()
     
     def clear_edits(self):
         """Clear all user edits"""
         self.edited_contours = []
         self.erased_contours = set()
-        self.erased_points = set()
+        self.erase_mask = None
+        # Erased geometry reappears, so the next preview must redraw
+        self._last_preview_sig = None
         # Reset edit mode to view
         self.edit_mode = "view"
         self.dxf_canvas.config(cursor="")
@@ -1523,145 +2101,39 @@ class ImageEmbossGUI:
             self.dxf_canvas.delete(self.eraser_circle)
             self.eraser_circle = None
     
-    def store_slider_values(self):
-        """Store current slider values for potential reverting"""
-        self.previous_slider_values = {
-            "bilateral_d": self.bilateral_d_var.get(),
-            "bilateral_c": self.bilateral_c_var.get(),
-            "gaussian": self.gaussian_var.get(),
-            "canny_l": self.canny_l_var.get(),
-            "canny_u": self.canny_u_var.get(),
-            "thickness": self.thickness_var.get(),
-            "gap": self.gap_var.get(),
-            "largest": self.largest_var.get(),
-            "simplify": self.simplify_var.get(),
-            "scale": self.scale_var.get(),
-            "invert": self.invert_var.get()
-        }
-    
     def revert_slider_values(self):
-        """Revert slider values to previous state"""
-        if not self.previous_slider_values:
-            return
-            
-        self.bilateral_d_var.set(self.previous_slider_values["bilateral_d"])
-        self.bilateral_c_var.set(self.previous_slider_values["bilateral_c"])
-        self.gaussian_var.set(self.previous_slider_values["gaussian"])
-        self.canny_l_var.set(self.previous_slider_values["canny_l"])
-        self.canny_u_var.set(self.previous_slider_values["canny_u"])
-        self.thickness_var.set(self.previous_slider_values["thickness"])
-        self.gap_var.set(self.previous_slider_values["gap"])
-        self.largest_var.set(self.previous_slider_values["largest"])
-        self.simplify_var.set(self.previous_slider_values["simplify"])
-        self.scale_var.set(self.previous_slider_values["scale"])
-        self.invert_var.set(self.previous_slider_values["invert"])
+        """Put the sliders back to the parameters of the last accepted change"""
+        # self.params is only rewritten by update_preview, i.e. once a change
+        # goes through, so it still holds the values from before this one
+        for attr, key in self._PRESET_APPLIERS:
+            getattr(self, attr).set(self.params[key])
         
         # Update labels to reflect reverted values
-        self.bilateral_d_label.config(text=str(self.previous_slider_values["bilateral_d"]))
-        self.bilateral_c_label.config(text=str(self.previous_slider_values["bilateral_c"]))
-        self.gaussian_label.config(text=str(self.previous_slider_values["gaussian"]))
-        self.canny_l_label.config(text=str(self.previous_slider_values["canny_l"]))
-        self.canny_u_label.config(text=str(self.previous_slider_values["canny_u"]))
-        self.thickness_label.config(text=f"{self.previous_slider_values['thickness']:.1f}")
-        self.gap_label.config(text=f"{self.previous_slider_values['gap']:.1f}")
-        self.largest_label.config(text=str(self.previous_slider_values["largest"]))
-        self.simplify_label.config(text=f"{self.previous_slider_values['simplify']:.1f}")
-        self.scale_label.config(text=f"{self.previous_slider_values['scale']:.3f}")
+        self.bilateral_d_label.config(text=str(self.params["bilateral_diameter"]))
+        self.bilateral_c_label.config(text=str(self.params["bilateral_sigma_color"]))
+        self.gaussian_label.config(text=str(self.params["gaussian_kernel_size"]))
+        self.canny_l_label.config(text=str(self.params["canny_lower_threshold"]))
+        self.canny_u_label.config(text=str(self.params["canny_upper_threshold"]))
+        self.thickness_label.config(text=f"{self.params['edge_thickness']:.1f}")
+        self.gap_label.config(text=f"{self.params['gap_threshold']:.1f}")
+        self.largest_label.config(text=str(self.params["largest_n"]))
+        self.simplify_label.config(text=f"{self.params['simplify_pct']:.1f}")
+        self.scale_label.config(text=f"{self.params['mm_per_px']:.3f}")
     
     def on_slider_start_change(self, event=None):
-        """Called when slider starts changing - store current values first"""
-        # Store current values before any change
-        self.store_slider_values()
-        # Then proceed with normal parameter change
+        """Called on every slider tick (ttk.Scale runs its command after the value moved)"""
         self.on_param_change(event)
     
-    # Individual preset change methods
-    def on_bilateral_d_preset_change(self):
-        presets = {"Small": 6, "Medium": 9, "Large": 12}
-        preset = self.bilateral_d_preset_var.get()
-        if preset in presets:
-            self.store_slider_values()  # Store before change
-            self.bilateral_d_var.set(presets[preset])
-            self.bilateral_d_label.config(text=str(presets[preset]))
-            self.on_param_change()
-    
-    def on_bilateral_c_preset_change(self):
-        presets = {"Low": 40, "Medium": 75, "High": 120}
-        preset = self.bilateral_c_preset_var.get()
-        if preset in presets:
-            self.store_slider_values()
-            self.bilateral_c_var.set(presets[preset])
-            self.bilateral_c_label.config(text=str(presets[preset]))
-            self.on_param_change()
-    
-    def on_gaussian_preset_change(self):
-        presets = {"Light": 3, "Medium": 5, "Heavy": 7}
-        preset = self.gaussian_preset_var.get()
-        if preset in presets:
-            self.store_slider_values()
-            self.gaussian_var.set(presets[preset])
-            self.gaussian_label.config(text=str(presets[preset]))
-            self.on_param_change()
-    
-    def on_canny_preset_change(self):
-        presets = {
-            "Sensitive": {"lower": 20, "upper": 60},
-            "Medium": {"lower": 30, "upper": 100},
-            "Conservative": {"lower": 50, "upper": 150}
-        }
-        preset = self.canny_preset_var.get()
-        if preset in presets:
-            self.store_slider_values()
-            self.canny_l_var.set(presets[preset]["lower"])
-            self.canny_u_var.set(presets[preset]["upper"])
-            self.canny_l_label.config(text=str(presets[preset]["lower"]))
-            self.canny_u_label.config(text=str(presets[preset]["upper"]))
-            self.on_param_change()
-    
-    def on_thickness_preset_change(self):
-        presets = {"Thin": 1.0, "Medium": 2.5, "Thick": 6.0}
-        preset = self.thickness_preset_var.get()
-        if preset in presets:
-            self.store_slider_values()
-            self.thickness_var.set(presets[preset])
-            self.thickness_label.config(text=str(presets[preset]))
-            self.on_param_change()
-    
-    def on_gap_preset_change(self):
-        presets = {"None": 0.0, "Light": 2.5, "Medium": 5.0, "Heavy": 10.0}
-        preset = self.gap_preset_var.get()
-        if preset in presets:
-            self.store_slider_values()
-            self.gap_var.set(presets[preset])
-            self.gap_label.config(text=str(presets[preset]))
-            self.on_param_change()
-    
-    def on_largest_preset_change(self):
-        presets = {"Few": 3, "Medium": 10, "Many": 30}
-        preset = self.largest_preset_var.get()
-        if preset in presets:
-            self.store_slider_values()
-            self.largest_var.set(presets[preset])
-            self.largest_label.config(text=str(presets[preset]))
-            self.on_param_change()
-    
-    def on_simplify_preset_change(self):
-        presets = {"Detailed": 0.2, "Medium": 0.5, "Simple": 1.0}
-        preset = self.simplify_preset_var.get()
-        if preset in presets:
-            self.store_slider_values()
-            self.simplify_var.set(presets[preset])
-            self.simplify_label.config(text=str(presets[preset]))
-            self.on_param_change()
-    
-    def on_scale_preset_change(self):
-        presets = {"Small": 0.15, "Medium": 0.25, "Large": 1.0}
-        preset = self.scale_preset_var.get()
-        if preset in presets:
-            self.store_slider_values()
-            self.scale_var.set(presets[preset])
-            self.scale_label.config(text=str(presets[preset]))
-            self.on_param_change()
+    def on_slider_preset_change(self, preset_attr):
+        """Apply the choice of one per-slider preset combobox (see _SLIDER_PRESETS)"""
+        values = self._SLIDER_PRESETS[preset_attr].get(getattr(self, preset_attr).get())
+        if values is None:
+            return
+        for var_attr, value in values.items():
+            getattr(self, var_attr).set(value)
+            # Each slider's value label is named after its variable (x_var -> x_label)
+            getattr(self, var_attr[:-len("_var")] + "_label").config(text=str(value))
+        self.on_param_change()
     
     def on_export_scale_change(self, event=None):
         """Update output size display when export scale changes"""
@@ -1669,7 +2141,7 @@ class ImageEmbossGUI:
             try:
                 scale = float(self.export_scale_var.get())
                 if scale > 0:
-                    h, w = self.original_image.shape[:2]
+                    h, w = self._source_size
                     new_h = int(h * scale)
                     new_w = int(w * scale)
                     self.output_size_label.config(text=f"Output: {new_w}×{new_h}px")
@@ -1684,37 +2156,16 @@ class ImageEmbossGUI:
         if preset == "Custom":
             return
 
-        config = self.preset_configs.get(preset)
+        config = _PRESETS.get(preset)
         if not config:
             return
 
-        # Store current values before applying preset
-        self.store_slider_values()
-
-        # Apply preset values directly to tkinter variables
-        self.bilateral_d_var.set(config["bilateral_diameter"])
-        self.bilateral_c_var.set(config["bilateral_sigma_color"])
-        self.gaussian_var.set(config["gaussian_kernel_size"])
-        self.canny_l_var.set(config["canny_lower_threshold"])
-        self.canny_u_var.set(config["canny_upper_threshold"])
-        self.thickness_var.set(config["edge_thickness"])
-        self.gap_var.set(config["gap_threshold"])
-        self.largest_var.set(config["largest_n"])
-        self.simplify_var.set(config["simplify_pct"])
-        self.scale_var.set(config["mm_per_px"])
-        self.invert_var.set(config["invert"])
-
-        # Update labels to reflect new values
-        self.bilateral_d_label.config(text=str(config["bilateral_diameter"]))
-        self.bilateral_c_label.config(text=str(config["bilateral_sigma_color"]))
-        self.gaussian_label.config(text=str(config["gaussian_kernel_size"]))
-        self.canny_l_label.config(text=str(config["canny_lower_threshold"]))
-        self.canny_u_label.config(text=str(config["canny_upper_threshold"]))
-        self.thickness_label.config(text=str(config["edge_thickness"]))
-        self.gap_label.config(text=str(config["gap_threshold"]))
-        self.largest_label.config(text=str(config["largest_n"]))
-        self.simplify_label.config(text=str(config["simplify_pct"]))
-        self.scale_label.config(text=str(config["mm_per_px"]))
+        # Apply preset values directly to tkinter variables (no traces are
+        # attached, so nothing fires until update_preview below, which also
+        # refreshes the value labels)
+        for attr, key in self._PRESET_APPLIERS:
+            getattr(self, attr).set(config[key])
+        self.params["max_vertices"] = config["max_vertices"]
 
         # Reset zoom/pan when preset changes
         self.zoom_reset()
@@ -1737,27 +2188,49 @@ class ImageEmbossGUI:
         except ValueError:
             messagebox.showerror("Error", "Invalid export scale value.")
             return
+            
+        if self.current_mask is None:
+            messagebox.showwarning("Warning", "Preview is still processing, please try again.")
+            return
 
         self.show_loading("Preparing DXF export...")
         
+        # Every export takes its geometry from the same pipeline call as the
+        # preview, run off the UI thread behind any pending preview job. With
+        # the shared stage cache this is usually a cache hit, and it yields the
+        # contours the erase mask, erased indices and edits were placed against.
+        image = self.original_image
+        future = self._pipeline_executor.submit(process_image, image, dict(self.params),
+                                                self._stage_cache, self._simplify_pool)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._finish_export, image, export_scale, f))
+        
+    def _finish_export(self, image, export_scale, future):
+        """Collect the pipeline's contours and write the DXF (UI thread)"""
+        if image is not self.original_image:
+            # A different image was loaded meanwhile; its loader owns the overlay
+            return
+            
         try:
-            # Process contours with gap threshold for export
-            export_contours = contours_from_mask(self.current_mask, 
-                                               self.params["largest_n"], 
-                                               self.params["simplify_pct"],
-                                               self.params["gap_threshold"])
+            _, export_contours = future.result()
+        except Exception as e:
+            self.hide_loading()
+            messagebox.showerror("Error", f"Export failed: {str(e)}")
+            return
             
+        self._write_export(export_scale, export_contours)
+        
+    def _write_export(self, export_scale, export_contours):
+        """Merge the user's edits into export_contours, ask for a path and write the DXF"""
+        try:
             # Filter out erased contours and add edited contours
             filtered_contours = []
             for i, contour in enumerate(export_contours):
                 if i not in self.erased_contours:
                     # Filter out individual erased points within contours
-                    filtered_contour = []
-                    for j, point in enumerate(contour):
-                        if (i, j) not in self.erased_points:
-                            filtered_contour.append(point)
-                    if len(filtered_contour) >= 3:  # Only add if enough points remain
-                        filtered_contours.append(np.array(filtered_contour, dtype=np.int32))
+                    kept = self.kept_points(contour)
+                    if len(kept) >= 3:  # Only add if enough points remain
+                        filtered_contours.append(kept.reshape(-1, 1, 2))
             
             # Add manually edited contours
             filtered_contours.extend(self.edited_contours)
@@ -1767,12 +2240,13 @@ class ImageEmbossGUI:
                 return
                 
             # Get scaled dimensions for filename
-            h, w = self.original_image.shape[:2]
+            h, w = self._source_size
             new_h, new_w = int(h * export_scale), int(w * export_scale)
             base_name = os.path.splitext(os.path.basename(self.image_path))[0]
             default_name = f"{base_name}_{new_w}x{new_h}.dxf"
             
             out_path = filedialog.asksaveasfilename(
+                parent=self.root,
                 title="Save DXF as",
                 defaultextension=".dxf",
                 initialfile=default_name,
@@ -1781,10 +2255,11 @@ class ImageEmbossGUI:
             
             if out_path:
                 # Calculate the effective mm_per_px based on export scale
-                # The scale slider controls the base mm_per_px, export scale multiplies the output size
-                effective_mm_per_px = self.params["mm_per_px"] / export_scale
+                # The scale slider controls the base mm_per_px, export scale multiplies the output size.
+                # mm_per_px refers to source pixels, so undo any downscale applied on load.
+                effective_mm_per_px = self.params["mm_per_px"] * self._input_scale / export_scale
                 
-                export_dxf(filtered_contours, out_path, self.current_mask.shape[:2], 
+                export_dxf(filtered_contours, out_path, self.original_image.shape[:2], 
                           effective_mm_per_px)
                 messagebox.showinfo("Success", f"DXF saved to:\n{out_path}\nSize: {new_w}×{new_h}px")
                 
@@ -1794,7 +2269,11 @@ class ImageEmbossGUI:
             self.hide_loading()
     
     def run(self):
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._pipeline_executor.shutdown(wait=False)
+            self._simplify_pool.shutdown(wait=False)
 
 # -------------------------
 # Main